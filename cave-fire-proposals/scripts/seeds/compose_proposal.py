@@ -1,6 +1,6 @@
 """Compose a proposal by resolving line item codes against `seeds/add_ons.json`.
 
-Usage: python3 scripts/seeds/compose_proposal.py seeds/default_proposal.json
+Usage: python3 -m scripts.seeds.compose_proposal seeds/default_proposal.json [JURISDICTION ...]
 """
 
 import json
@@ -8,11 +8,11 @@ from decimal import Decimal
 from pathlib import Path
 import sys
 
+from scripts.seeds.tax_rules import jurisdiction_codes, load_tax_table, lookup_rate
+
 ROOT = Path(__file__).resolve().parents[2]
 ADDONS_PATH = ROOT / "seeds" / "add_ons.json"
 
-TAX_RATE = Decimal("0.0875")
-
 
 def load_json(path: Path):
     with open(path, "r", encoding="utf-8") as fh:
@@ -31,47 +31,82 @@ def compose(proposal_path):
     return compose_from_data(proposal)
 
 
-def compose_from_data(proposal: dict):
-    """Compose totals for an in-memory proposal dict (useful for APIs)."""
-    addons = load_json(ADDONS_PATH)
-    subtotal = Decimal("0.00")
-    tax_total = Decimal("0.00")
+def resolve_lines(proposal: dict, addons):
+    """Resolve line items to `(line_amount, category, taxable)` tuples.
 
-    # Resolve line items
+    Line amounts are rounded to cents. Unknown codes without an inline
+    `unit_price` are skipped.
+    """
+    by_code = {i.get("code"): i for i in addons}
+    lines = []
     for section in proposal.get("sections", []):
         for li in section.get("line_items", []) + section.get("add_ons", []):
-            code = li.get("code")
             qty = li.get("quantity", 1)
-            item = find_addon_by_code(addons, code)
+            item = by_code.get(li.get("code"))
             if item is None:
                 # unknown code — skip and warn (caller may supply inline unit_price)
-                if li.get("unit_price") is not None:
-                    unit_price = Decimal(str(li.get("unit_price")))
-                else:
+                if li.get("unit_price") is None:
                     # skip silently
                     continue
-            else:
-                unit_price = Decimal(str(item["unit_price"]))
+                item = li
+            unit_price = Decimal(str(item["unit_price"]))
             line = (unit_price * Decimal(qty)).quantize(Decimal("0.01"))
-            subtotal += line
-            taxable = False
-            if item is not None:
-                taxable = item.get("taxable", False)
-            else:
-                taxable = li.get("taxable", False)
-            if taxable:
-                tax = (line * TAX_RATE).quantize(Decimal("0.01"))
-                tax_total += tax
+            lines.append((line, item.get("category"), item.get("taxable", False)))
+    return lines
+
+
+def _totals(lines, rates):
+    # `rates` is the (category -> rate) slice for one jurisdiction
+    subtotal = Decimal("0.00")
+    tax_total = Decimal("0.00")
+    for line, category, taxable in lines:
+        subtotal += line
+        if taxable:
+            tax_total += (line * rates[category]).quantize(Decimal("0.01"))
     total = (subtotal + tax_total).quantize(Decimal("0.01"))
     return {"subtotal": subtotal, "tax": tax_total, "total": total}
 
 
+def _rates_for(table, jurisdiction, lines):
+    return {c: lookup_rate(table, jurisdiction, c) for c in {c for _, c, _ in lines}}
+
+
+def compose_from_data(proposal: dict, jurisdiction: str = None):
+    """Compose totals for an in-memory proposal dict (useful for APIs).
+
+    The jurisdiction defaults to the proposal's `jurisdiction` key, then to
+    the default in `seeds/tax_rules.json`.
+    """
+    default, table = load_tax_table()
+    jurisdiction = jurisdiction or proposal.get("jurisdiction") or default
+    lines = resolve_lines(proposal, load_json(ADDONS_PATH))
+    return _totals(lines, _rates_for(table, jurisdiction, lines))
+
+
+def compose_for_jurisdictions(proposal: dict, jurisdictions=None):
+    """Price one proposal under many jurisdictions in a single call.
+
+    Line items are resolved once and reused for every jurisdiction. Returns a
+    dict of jurisdiction -> totals; all known jurisdictions when none given.
+    """
+    _, table = load_tax_table()
+    if jurisdictions is None:
+        jurisdictions = jurisdiction_codes(table)
+    lines = resolve_lines(proposal, load_json(ADDONS_PATH))
+    return {j: _totals(lines, _rates_for(table, j, lines)) for j in jurisdictions}
+
+
 if __name__ == "__main__":
     if len(sys.argv) > 1:
         path = Path(sys.argv[1])
     else:
         path = ROOT / "seeds" / "default_proposal.json"
 
-    out = compose(path)
-    print("Proposal totals:")
-    print(out)
+    if len(sys.argv) > 2:
+        proposal = load_json(path)
+        for j, out in compose_for_jurisdictions(proposal, sys.argv[2:]).items():
+            print(f"{j}: {out}")
+    else:
+        out = compose(path)
+        print("Proposal totals:")
+        print(out)
@@ -0,0 +1,62 @@
+"""Jurisdiction tax rules compiled into a flat (jurisdiction, category) -> rate table.
+
+Rules live in `seeds/tax_rules.json`: each jurisdiction has a base rate and
+optional per-category overrides (use "0.0000" for an exempt category). The
+rules are compiled once at load time so pricing code only does dict lookups.
+
+Usage: python3 scripts/seeds/tax_rules.py
+"""
+
+import json
+from decimal import Decimal
+from functools import lru_cache
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+TAX_RULES_PATH = ROOT / "seeds" / "tax_rules.json"
+
+
+def compile_tax_rules(rules: dict):
+    """Compile a rules dict into `(default_jurisdiction, table)`.
+
+    `table` maps `(jurisdiction, category)` to a Decimal rate. Each
+    jurisdiction also gets a `(jurisdiction, None)` entry holding its base
+    rate, used for categories without an override.
+    """
+    table = {}
+    for j in rules.get("jurisdictions", []):
+        code = j["code"]
+        base = Decimal(str(j["rate"]))
+        table[(code, None)] = base
+        for category, rate in j.get("categories", {}).items():
+            table[(code, category)] = Decimal(str(rate))
+    default = rules.get("default_jurisdiction")
+    if default is not None and (default, None) not in table:
+        raise ValueError(f"default jurisdiction {default!r} has no rules")
+    return default, table
+
+
+@lru_cache(maxsize=None)
+def load_tax_table(path: Path = TAX_RULES_PATH):
+    with open(path, "r", encoding="utf-8") as fh:
+        return compile_tax_rules(json.load(fh))
+
+
+def lookup_rate(table: dict, jurisdiction: str, category=None) -> Decimal:
+    rate = table.get((jurisdiction, category))
+    if rate is None:
+        rate = table.get((jurisdiction, None))
+        if rate is None:
+            raise ValueError(f"unknown tax jurisdiction: {jurisdiction!r}")
+    return rate
+
+
+def jurisdiction_codes(table: dict):
+    return [j for (j, category) in table if category is None]
+
+
+if __name__ == "__main__":
+    default, table = load_tax_table()
+    print("Default jurisdiction:", default)
+    for (j, category), rate in sorted(table.items(), key=lambda kv: (kv[0][0], kv[0][1] or "")):
+        print(f"{j} {category or '*'}: {rate}")
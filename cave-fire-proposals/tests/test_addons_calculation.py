@@ -29,3 +29,9 @@ def test_load_and_sample_totals():
     for i in items:
         assert "unit_price" in i
         assert "default_quantity" in i
+
+
+def test_calculate_line_total_category_override():
+    # Tucson taxes sprinkler work at a reduced rate: 100.00 * 6.10% => 6.10
+    total = calculate_line_total(100.0, 1, True, "sprinkler", "AZ-TUCSON")
+    assert total == Decimal("106.10")
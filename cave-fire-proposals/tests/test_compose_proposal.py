@@ -1,7 +1,14 @@
 from pathlib import Path
 from decimal import Decimal
 
-from scripts.seeds.compose_proposal import compose
+import pytest
+
+from scripts.seeds.compose_proposal import (
+    compose,
+    compose_for_jurisdictions,
+    compose_from_data,
+    load_json,
+)
 
 
 def test_compose_default_proposal():
@@ -12,3 +19,30 @@ def test_compose_default_proposal():
     # Tax is calculated per-line and rounded to cents before summing
     assert out["tax"] == Decimal("9.35")
     assert out["total"] == Decimal("706.25")
+
+
+def test_compose_uses_proposal_jurisdiction():
+    root = Path(__file__).resolve().parents[1]
+    proposal = load_json(root / "seeds" / "default_proposal.json")
+    proposal["jurisdiction"] = "AZ-MARICOPA-UNINC"
+    out = compose_from_data(proposal)
+    # extinguisher lines are exempt in this jurisdiction
+    assert out["tax"] == Decimal("0.00")
+    assert out["total"] == Decimal("696.90")
+
+
+def test_compose_for_jurisdictions_matches_single_compose():
+    root = Path(__file__).resolve().parents[1]
+    proposal = load_json(root / "seeds" / "default_proposal.json")
+    out = compose_for_jurisdictions(proposal, ["AZ-PHOENIX", "AZ-TEMPE"])
+    assert list(out) == ["AZ-PHOENIX", "AZ-TEMPE"]
+    for j, totals in out.items():
+        assert totals == compose_from_data(proposal, j)
+    assert out["AZ-PHOENIX"]["tax"] == Decimal("9.35")
+
+
+def test_compose_unknown_jurisdiction():
+    root = Path(__file__).resolve().parents[1]
+    proposal = load_json(root / "seeds" / "default_proposal.json")
+    with pytest.raises(ValueError):
+        compose_from_data(proposal, "AZ-NOWHERE")
@@ -0,0 +1,38 @@
+from decimal import Decimal
+
+import pytest
+
+from scripts.seeds.tax_rules import compile_tax_rules, load_tax_table, lookup_rate
+
+RULES = {
+    "default_jurisdiction": "X",
+    "jurisdictions": [
+        {"code": "X", "rate": "0.05", "categories": {"exempt": "0"}},
+        {"code": "Y", "rate": "0.10"},
+    ],
+}
+
+
+def test_compile_tax_rules():
+    default, table = compile_tax_rules(RULES)
+    assert default == "X"
+    assert lookup_rate(table, "X", "exempt") == Decimal("0")
+    # categories without an override fall back to the base rate
+    assert lookup_rate(table, "X", "sprinkler") == Decimal("0.05")
+    assert lookup_rate(table, "Y", None) == Decimal("0.10")
+
+
+def test_lookup_unknown_jurisdiction():
+    _, table = compile_tax_rules(RULES)
+    with pytest.raises(ValueError):
+        lookup_rate(table, "Z", "sprinkler")
+
+
+def test_compile_rejects_missing_default():
+    with pytest.raises(ValueError):
+        compile_tax_rules({"default_jurisdiction": "Z", "jurisdictions": []})
+
+
+def test_seed_tax_rules_default():
+    default, table = load_tax_table()
+    assert lookup_rate(table, default, None) == Decimal("0.0875")